@@ -11,9 +11,7 @@ bl_info = {
 import bpy
 import os
 import mathutils
-
-scene = bpy.types.Scene
-context = bpy.context
+import numpy as np
 
 #----- EXPORT Property ------
 
@@ -21,7 +19,7 @@ context = bpy.context
 
 class ExportOptions(bpy.types.PropertyGroup):
 
-    scene.export_types = bpy.props.EnumProperty(
+    export_types: bpy.props.EnumProperty(
         name="Export Types",
         description="File format",
         items=[
@@ -64,138 +62,190 @@ class ExportOptions(bpy.types.PropertyGroup):
         default=False,
     )
 
-scene.batch_export = bpy.props.BoolProperty(
-    name="Batch Export",
-    description="Export each selected object to its own file",
-    default=False,
-)
+    batch_export: bpy.props.BoolProperty(
+        name="Batch Export",
+        description="Export each selected object to its own file",
+        default=False,
+    )
 
-scene.mesh_directory_path = bpy.props.StringProperty(
-    name="Directory Path",
-    subtype='DIR_PATH',
-    default="",
-    description="Choose a directory path"
-)
+    mesh_directory_path: bpy.props.StringProperty(
+        name="Directory Path",
+        subtype='DIR_PATH',
+        default="",
+        description="Choose a directory path"
+    )
 
-scene.set_file_name = bpy.props.StringProperty(
-    name="Set File Name",
-    subtype="FILE_NAME",
-    default="",
-    description="(Optional) Name of the exported file. If empty, uses the active object name."
-)
+    set_file_name: bpy.props.StringProperty(
+        name="Set File Name",
+        subtype="FILE_NAME",
+        default="",
+        description="(Optional) Name of the exported file. If empty, uses the active object name."
+    )
 
-scene.origin_at_bottom = bpy.props.BoolProperty(
-    name="Origin At bottom",
-    description="Export objects with origin at the bottom",
-    default=False
-)
-scene.custom_origin = bpy.props.BoolProperty(
-    name="Custom Origin",
-    description="The origin of the selected object will be place at the location of the empty at export time.",
-    default=False
+    origin_at_bottom: bpy.props.BoolProperty(
+        name="Origin At bottom",
+        description="Export objects with origin at the bottom",
+        default=False
+    )
+    custom_origin: bpy.props.BoolProperty(
+        name="Custom Origin",
+        description="The origin of the selected object will be place at the location of the empty at export time.",
+        default=False
+    )
+    selected_empty: bpy.props.StringProperty(
+        name="Custom Origin Empty",
+        default="",
+        description="(Optional) Name of the child empty used as origin. If empty, uses the first child empty."
     )
 
-def set_origin_at_bottom(obj):
-    if obj.mode != 'OBJECT':
-        bpy.ops.object.mode_set(mode='OBJECT')
-    
-    bpy.ops.object.transform_apply(rotation=True, scale=True)
-    bb = obj.bound_box
-    min_z = min([point[2] for point in bb])
-    centroid = mathutils.Vector(((bb[0][0] + bb[6][0]) / 2, (bb[0][1] + bb[2][1]) / 2, min_z))
-    
-    # Convert local bounding box position to global space
-    world_new_origin = obj.matrix_world @ centroid
-    obj.data.transform(mathutils.Matrix.Translation(-centroid))
-
-    return world_new_origin
-
-def set_origin_to_custom(selected_objects, context):
+    save_before_export: bpy.props.BoolProperty(
+        name="Save Before Export",
+        description="Save the .blend file before exporting, if it has unsaved changes",
+        default=False
+    )
+
+def get_children_by_parent():
+    # One pass over all objects, obj.children walks the whole scene on every access.
+    children_by_parent = {}
+    for obj in bpy.data.objects:
+        children_by_parent.setdefault(obj.parent, []).append(obj)
+    return children_by_parent
+
+def transform_origin(obj, matrix, children):
+    # Move the data by matrix and the object by its inverse, so the geometry
+    # and the children stay where they are in world space.
+    child_matrices = [(child, child.matrix_world.copy()) for child in children]
+    obj.data.transform(matrix, shape_keys=True)
+    obj.matrix_world = obj.matrix_world @ matrix.inverted()
+    for child, child_matrix in child_matrices:
+        child.matrix_world = child_matrix
+
+def set_origin_to_location(obj, location, children):
+    # Offset of the new origin in the object's local space.
+    delta = obj.matrix_world.inverted() @ location
+    transform_origin(obj, mathutils.Matrix.Translation(-delta), children)
+
+def read_vertex_positions(mesh):
+    vertex_co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", vertex_co)
+    return vertex_co
+
+def read_shape_key_positions(mesh):
+    # Shape keys are moved with the mesh, so they are backed up with it too.
+    if mesh.shape_keys is None:
+        return []
+    key_positions = []
+    for key_block in mesh.shape_keys.key_blocks:
+        key_co = np.empty(len(key_block.data) * 3, dtype=np.float32)
+        key_block.data.foreach_get("co", key_co)
+        key_positions.append((key_block, key_co))
+    return key_positions
+
+def set_origin_at_bottom(obj, children, vertex_co, depsgraph=None):
+    # vertex_co holds the positions of obj.data read before any edit. With a
+    # depsgraph, the evaluated object (modifiers applied) is read instead.
+    if depsgraph is not None:
+        eval_obj = obj.evaluated_get(depsgraph)
+        vertex_co = read_vertex_positions(eval_obj.to_mesh())
+        eval_obj.to_mesh_clear()
+    vertex_co = vertex_co.reshape(-1, 3)
+
+    # Bake rotation and scale into the data so the bounding box is axis aligned.
+    rotation_scale = obj.matrix_world.to_3x3()
+    if rotation_scale != mathutils.Matrix.Identity(3):
+        transform_origin(obj, rotation_scale.to_4x4(), children)
+        vertex_co = vertex_co @ np.array(rotation_scale, dtype=np.float32).T
+
+    if len(vertex_co):
+        bb_min = vertex_co.min(axis=0)
+        bb_max = vertex_co.max(axis=0)
+        translation = mathutils.Matrix.Identity(4)
+        translation[0][3] = -0.5 * float(bb_min[0] + bb_max[0])
+        translation[1][3] = -0.5 * float(bb_min[1] + bb_max[1])
+        translation[2][3] = -float(bb_min[2])
+        transform_origin(obj, translation, children)
+
+    # The object now sits on the new origin, in global space
+    return obj.matrix_world.translation.copy()
+
+def find_custom_empty(children, selected_empty):
+    # Find the custom empty (either specific one or any empty)
+    return next(
+        (child for child in children if child.type == 'EMPTY' and
+         (not selected_empty or child.name == selected_empty)),
+        None
+    )
+
+def set_origin_to_custom(selected_objects, context, children_by_parent):
+    selected_empty = context.scene.ExportOptions.selected_empty
+
     def process_obj(obj, context):
         if obj.type != 'MESH':
             return
 
-        # Find the custom empty (either specific one or any empty)
-        custom_empty = next(
-            (child for child in obj.children if child.type == 'EMPTY' and
-             (not context.scene.selected_empty or child.name == context.scene.selected_empty)),
-            None
-        )
+        children = children_by_parent.get(obj, ())
+        custom_empty = find_custom_empty(children, selected_empty)
 
         if custom_empty:
-            # Set the 3D cursor to the empty's world location
-            context.scene.cursor.location = custom_empty.matrix_world.translation.copy()
-
-            bpy.ops.object.select_all(action='DESELECT')
-            obj.select_set(True)
-            context.view_layer.objects.active = obj
-
-            # Set the origin to the 3D cursor
-            bpy.ops.object.origin_set(type='ORIGIN_CURSOR', center='MEDIAN')
-
-    # Process the selected objects (single or multiple)
-    if isinstance(selected_objects, (list, tuple)):
-        for obj in selected_objects:
-            process_obj(obj, context)
-    else:
-        process_obj(selected_objects, context)
+            # Set the origin to the empty's world location
+            set_origin_to_location(obj, custom_empty.matrix_world.translation.copy(), children)
 
     # Process either a list/tuple of objects or a single object.
-    if isinstance(selected_objects, (list, tuple)):
-        for obj in selected_objects:
-            process_obj(obj, context)
-    else:
-        process_obj(selected_objects, context)
-
-
-def manipulate_origin(selected_objects, context):
-
-    bpy.ops.object.select_all(action='DESELECT')
+    if not isinstance(selected_objects, (list, tuple)):
+        selected_objects = [selected_objects]
     for obj in selected_objects:
-        obj.select_set(True)
-        context.view_layer.objects.active = obj
-
-        if context.scene.origin_at_bottom:
-            set_origin_at_bottom(obj)
-        elif context.scene.selected_empty:
-            # Call our fixed set_origin_to_custom with a single object.
-            set_origin_to_custom(obj, context)
-        else:
-            # Set the 3D cursor to the object's location and update its origin.
-            context.scene.cursor.location = obj.location
-            bpy.ops.object.origin_set(type='ORIGIN_CURSOR', center='MEDIAN')
+        process_obj(obj, context)
+
+
+def get_use_modifiers(opts):
+    if opts.export_types == 'FBX':
+        return opts.include_modifiers_fbx
+    return opts.include_modifiers_obj
+
+def get_exporter(export_format, opts):
+    # Exporter operator and the options shared by all of its calls
+    if export_format == 'FBX':
+        return bpy.ops.export_scene.fbx, dict(
+            use_selection=True,
+            use_mesh_modifiers=opts.include_modifiers_fbx,
+            use_triangles=opts.use_triangles_fbx,
+            colors_type=opts.use_vertex_colors_fbx,
+        )
+    elif export_format == 'OBJ':
+        return bpy.ops.wm.obj_export, dict(
+            export_selected_objects=True,
+            apply_modifiers=opts.include_modifiers_obj,
+            export_triangulated_mesh=opts.use_triangles_obj,
+        )
+    return None, None
 
-        # Reset the object's location so that its new origin aligns with (0, 0, 0).
-        obj.location = (0, 0, 0)
-        obj.select_set(False)
+def export_objects(context, selected_objects, filepaths, export_format, opts):
+    view_layer_objects = context.view_layer.objects
+    select_all = bpy.ops.object.select_all
 
+    export_op, export_kwargs = get_exporter(export_format, opts)
+    if export_op is None:
+        return
 
-def export_objects(context, selected_objects, export_format, mesh_directory_path, use_modifiers, use_triangulation, use_vertex_colors):
-    # Export Options
-    for selected_obj in selected_objects:
-        context.view_layer.objects.active = selected_obj
-        bpy.ops.object.select_all(action='DESELECT')  # Deselect all objects first
+    for selected_obj, object_filepath in zip(selected_objects, filepaths):
+        if export_format == 'FBX':
+            # The FBX exporter reads context.selected_objects, so override the
+            # context instead of changing the selection.
+            with context.temp_override(
+                active_object=selected_obj,
+                selected_objects=[selected_obj],
+                selected_editable_objects=[selected_obj],
+            ):
+                export_op(filepath=object_filepath, **export_kwargs)
+            continue
+
+        # The OBJ exporter reads the selection state of the objects themselves.
+        view_layer_objects.active = selected_obj
+        select_all(action='DESELECT')  # Deselect all objects first
         selected_obj.select_set(True)  # Select only the current object
 
         # Export this selected object individually
-        object_file_name = bpy.path.clean_name(selected_obj.name) + "." + export_format.lower()
-        object_filepath = os.path.join(mesh_directory_path, object_file_name)
-
-        if export_format == 'FBX':
-            bpy.ops.export_scene.fbx(
-                filepath=object_filepath,
-                use_selection=True,
-                use_mesh_modifiers=use_modifiers,
-                use_triangles=use_triangulation,
-                colors_type=use_vertex_colors,
-            )
-        elif export_format == 'OBJ':
-            bpy.ops.wm.obj_export(
-                filepath=object_filepath,
-                export_selected_objects=True,
-                apply_modifiers=True,
-                export_triangulated_mesh=True,
-            )
+        export_op(filepath=object_filepath, **export_kwargs)
 
 class OBJECT_OT_ExportOperator(bpy.types.Operator):
     bl_idname = "object.basic_export"
@@ -203,101 +253,144 @@ class OBJECT_OT_ExportOperator(bpy.types.Operator):
     bl_description = "Export Selected Meshes"
 
     def execute(self, context):
-        bpy.ops.wm.save_as_mainfile(filepath=bpy.data.filepath)
+        opts = context.scene.ExportOptions
+        view_layer = context.view_layer
+        select_all = bpy.ops.object.select_all
+
+        # Flush any edit session into the object data before it is read.
+        if context.mode != 'OBJECT':
+            bpy.ops.object.mode_set(mode='OBJECT')
+
+        if opts.save_before_export and bpy.data.is_saved and bpy.data.is_dirty:
+            bpy.ops.wm.save_mainfile()
 
         # Filter selection: ignore empties (used only for origin placement).
-        selected_objects = [obj for obj in context.selected_objects if obj.type != 'EMPTY']
+        selected_objects = tuple(obj for obj in context.selected_objects if obj.type != 'EMPTY')
         if not selected_objects:
             self.report({'ERROR'}, "No valid mesh objects to export.")
             return {'CANCELLED'}
+        mesh_objects = tuple(obj for obj in selected_objects if obj.type == 'MESH')
+
+        if not opts.mesh_directory_path:
+            self.report({'ERROR'}, "No export directory set.")
+            return {'CANCELLED'}
+        mesh_directory_path = os.path.normpath(bpy.path.abspath(opts.mesh_directory_path))
+        try:
+            os.makedirs(mesh_directory_path, exist_ok=True)
+        except OSError as e:
+            self.report({'ERROR'}, f"Cannot create export directory: {e}")
+            return {'CANCELLED'}
+
+        export_format = opts.export_types
+        if opts.batch_export:
+            clean_name = bpy.path.clean_name
+            join = os.path.join
+            extension = "." + export_format.lower()
+            filepaths = [
+                join(mesh_directory_path, clean_name(obj.name) + extension)
+                for obj in selected_objects
+            ]
+
+            # Different names can clean to the same file name, e.g. "Cube.001"
+            # and "Cube_001", and file systems are often case insensitive.
+            # Export nothing rather than overwrite one with the other.
+            seen = set()
+            duplicates = []
+            for object_filepath in filepaths:
+                key = object_filepath.lower()
+                if key in seen:
+                    duplicates.append(os.path.basename(object_filepath))
+                seen.add(key)
+            if duplicates:
+                self.report({'ERROR'}, "Several objects export to the same file: " + ", ".join(duplicates))
+                return {'CANCELLED'}
 
         # --- STORE ORIGINAL STATE ---
+        children_by_parent = get_children_by_parent()
         original_matrices = {}
         original_vertices = {}
-        original_empty_transforms = {}
+        original_shape_keys = {}
+        original_child_transforms = {}
         for obj in selected_objects:
-            if obj.type == 'MESH':
-                original_matrices[obj.name] = obj.matrix_world.copy()
-                original_vertices[obj.name] = [v.co.copy() for v in obj.data.vertices]
-            # Store transforms of any child empties.
-            for child in obj.children:
-                if child.type == 'EMPTY':
-                    original_empty_transforms[child.name] = child.matrix_world.copy()
+            original_matrices[obj.name] = obj.matrix_world.copy()
+            # Store transforms of the children (custom origin empties included).
+            for child in children_by_parent.get(obj, ()):
+                original_child_transforms[child.name] = child.matrix_world.copy()
+        # Only meshes whose origin moves get their vertices edited.
+        if opts.custom_origin:
+            selected_empty = opts.selected_empty
+            edited_meshes = tuple(
+                obj for obj in mesh_objects
+                if find_custom_empty(children_by_parent.get(obj, ()), selected_empty)
+            )
+        elif opts.origin_at_bottom:
+            edited_meshes = mesh_objects
+        else:
+            edited_meshes = ()
+        # Moving the origin of a shared mesh would move it for every user.
+        shared = [obj.name for obj in edited_meshes if obj.data.users - obj.data.use_fake_user > 1]
+        if shared:
+            self.report({'ERROR'}, "Cannot move the origin of multi user meshes: " + ", ".join(shared))
+            return {'CANCELLED'}
+        for obj in edited_meshes:
+            original_vertices[obj.data] = read_vertex_positions(obj.data)
+            original_shape_keys[obj.data] = read_shape_key_positions(obj.data)
 
+        # Meshes whose vertices were actually transformed and need restoring.
+        dirty_meshes = set()
         try:
             # --- ORIGIN HANDLING ---
-            if context.scene.custom_origin:
-                set_origin_to_custom(selected_objects, context)
-            elif context.scene.origin_at_bottom:
-                for obj in selected_objects:
-                    set_origin_at_bottom(obj)
-            else:
-                for obj in selected_objects:
-                    context.scene.cursor.location = obj.location.copy()
-                    bpy.ops.object.select_all(action='DESELECT')
-                    obj.select_set(True)
-                    context.view_layer.objects.active = obj
-                    bpy.ops.object.origin_set(type='ORIGIN_CURSOR', center='MEDIAN')
+            if opts.custom_origin:
+                for obj in edited_meshes:
+                    dirty_meshes.add(obj.data)
+                    set_origin_to_custom(obj, context, children_by_parent)
+            elif opts.origin_at_bottom:
+                # Evaluated once, so the bottom matches the exported geometry.
+                depsgraph = context.evaluated_depsgraph_get() if get_use_modifiers(opts) else None
+                for obj in edited_meshes:
+                    dirty_meshes.add(obj.data)
+                    set_origin_at_bottom(
+                        obj, children_by_parent.get(obj, ()),
+                        original_vertices[obj.data], depsgraph,
+                    )
 
             # --- MOVE OBJECTS TO (0, 0, 0) FOR EXPORT ---
             for obj in selected_objects:
-                obj.location = (0, 0, 0)
+                obj.matrix_world = mathutils.Matrix.Translation(-obj.matrix_world.translation) @ obj.matrix_world
 
             # --- EXPORT SETTINGS & PROCESS ---
-            use_modifiers = context.scene.ExportOptions.include_modifiers_fbx
-            use_triangulation = context.scene.ExportOptions.use_triangles_fbx
-            use_vertex_colors = context.scene.ExportOptions.use_vertex_colors_fbx
-
-            export_format = context.scene.export_types
-            mesh_directory_path = bpy.path.abspath(context.scene.mesh_directory_path)
-            if not os.path.exists(mesh_directory_path):
-                os.makedirs(mesh_directory_path)
-
-            if context.scene.batch_export:
+            if opts.batch_export:
                 # Export each object individually.
-                export_objects(context, selected_objects, export_format, mesh_directory_path, use_modifiers, use_triangulation, use_vertex_colors)
+                export_objects(context, selected_objects, filepaths, export_format, opts)
             else:
                 # Single export: export all selected objects together.
-                bpy.ops.object.select_all(action='DESELECT')
+                select_all(action='DESELECT')
                 for obj in selected_objects:
                     obj.select_set(True)
-                active_object = context.view_layer.objects.active
-                file_base_name = bpy.path.clean_name(context.scene.set_file_name or active_object.name)
+                active_object = view_layer.objects.active
+                file_base_name = bpy.path.clean_name(opts.set_file_name or active_object.name)
                 file_name = f"{file_base_name}.{export_format.lower()}"
                 filepath = os.path.join(mesh_directory_path, file_name)
 
-                if export_format == 'FBX':
-                    bpy.ops.export_scene.fbx(
-                        filepath=filepath,
-                        use_selection=True,
-                        use_mesh_modifiers=use_modifiers,
-                        use_triangles=use_triangulation,
-                        colors_type=use_vertex_colors,
-                    )
-                elif export_format == 'OBJ':
-                    bpy.ops.wm.obj_export(
-                        filepath=filepath,
-                        export_selected_objects=True,
-                        apply_modifiers=True,
-                        export_trianguled_mesh=True,
-                    )
+                export_op, export_kwargs = get_exporter(export_format, opts)
+                if export_op is not None:
+                    export_op(filepath=filepath, **export_kwargs)
 
         finally:
             # --- RESTORE ORIGINAL STATE FOR OBJECTS ---
+            for mesh in dirty_meshes:
+                mesh.vertices.foreach_set("co", original_vertices[mesh])
+                for key_block, key_co in original_shape_keys[mesh]:
+                    key_block.data.foreach_set("co", key_co)
+                mesh.update()
             for obj in selected_objects:
-                if obj.type == 'MESH' and obj.name in original_vertices:
-                    for i, v in enumerate(obj.data.vertices):
-                        v.co = original_vertices[obj.name][i]
-                    obj.data.update()
                 if obj.name in original_matrices:
                     obj.matrix_world = original_matrices[obj.name]
-            # --- RESTORE ORIGINAL STATE FOR EMPTIES ---
-            for empty_name, matrix in original_empty_transforms.items():
-                empty_obj = bpy.data.objects.get(empty_name)
-                if empty_obj:
-                    empty_obj.matrix_world = matrix
-
-            bpy.ops.view3d.snap_cursor_to_center()
+            # --- RESTORE ORIGINAL STATE FOR CHILDREN ---
+            for child_name, matrix in original_child_transforms.items():
+                child_obj = bpy.data.objects.get(child_name)
+                if child_obj:
+                    child_obj.matrix_world = matrix
 
         return {'FINISHED'}
 
@@ -310,35 +403,38 @@ class View3D_PT_Export_Utility(bpy.types.Panel):
 
     def draw(self, context):
         layout = self.layout
-        scene = context.scene
+        opts = context.scene.ExportOptions
         box = layout.box()
 
         box.label(icon="FILE_FOLDER", text="Path")
-        box.prop(context.scene, "mesh_directory_path", text="Folder")
-        if not context.scene.batch_export:
-            box.prop(context.scene, "set_file_name", text="File Name")
+        box.prop(opts, "mesh_directory_path", text="Folder")
+        if not opts.batch_export:
+            box.prop(opts, "set_file_name", text="File Name")
 
         box = layout.box()
 
         box.label(icon="OPTIONS",text="Options")
         row = box.row(align=True)
-        row.prop(scene, "export_types", expand=True)
-        box.prop(scene, "batch_export", icon="FILE_VOLUME", text="Batch Export")
-        box.prop(scene, "origin_at_bottom", icon="OBJECT_ORIGIN", text="Origin At Bottom")
-        box.prop(scene, "custom_origin", icon="TRANSFORM_ORIGINS", text="Custom Origin")
+        row.prop(opts, "export_types", expand=True)
+        box.prop(opts, "batch_export", icon="FILE_VOLUME", text="Batch Export")
+        box.prop(opts, "origin_at_bottom", icon="OBJECT_ORIGIN", text="Origin At Bottom")
+        box.prop(opts, "custom_origin", icon="TRANSFORM_ORIGINS", text="Custom Origin")
+        if opts.custom_origin:
+            box.prop_search(opts, "selected_empty", context.scene, "objects", icon="EMPTY_AXIS", text="Empty")
 
         box.separator(type='LINE')
 
-        if context.scene.export_types == 'FBX':
-            box.prop(scene.ExportOptions, "include_modifiers_fbx", icon="MODIFIER", text="Export With Modifiers")
-            box.prop(scene.ExportOptions, "use_triangles_fbx", icon="MOD_TRIANGULATE", text="Triangulation")
-            box.prop(scene.ExportOptions, "use_vertex_colors_fbx", icon="UV_VERTEXSEL", text="Vertex Col.")
-        elif context.scene.export_types == 'OBJ':
-            box.prop(scene.ExportOptions, "include_modifiers_obj", icon="MODIFIER", text="Include Modifiers")
-            box.prop(scene.ExportOptions, "use_triangles_obj", icon="MOD_TRIANGULATE", text="Triangulation")
+        if opts.export_types == 'FBX':
+            box.prop(opts, "include_modifiers_fbx", icon="MODIFIER", text="Export With Modifiers")
+            box.prop(opts, "use_triangles_fbx", icon="MOD_TRIANGULATE", text="Triangulation")
+            box.prop(opts, "use_vertex_colors_fbx", icon="UV_VERTEXSEL", text="Vertex Col.")
+        elif opts.export_types == 'OBJ':
+            box.prop(opts, "include_modifiers_obj", icon="MODIFIER", text="Include Modifiers")
+            box.prop(opts, "use_triangles_obj", icon="MOD_TRIANGULATE", text="Triangulation")
 
         box = layout.box()
 
+        box.prop(opts, "save_before_export", icon="FILE_TICK", text="Save Before Export")
         box.operator("object.basic_export", text="Export", icon="EXPORT")
 
 classes = (
@@ -353,9 +449,14 @@ def register():
     bpy.types.Scene.ExportOptions = bpy.props.PointerProperty(type=ExportOptions)
 
 def unregister():
-    for cls in classes:
-        bpy.utils.unregister_class(cls)
-    del bpy.types.Scene.ExportOptions
+    # Tolerate a partial registration, e.g. after a failed register().
+    try:
+        del bpy.types.Scene.ExportOptions
+    except AttributeError:
+        pass
+    for cls in reversed(classes):
+        if cls.is_registered:
+            bpy.utils.unregister_class(cls)
 
 if __name__ == "__main__":
     register()
\ No newline at end of file